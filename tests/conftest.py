@@ -14,7 +14,11 @@
 # along with this program; if not, write to the Free Software Foundation,
 # Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
 
-"""Generic fixtures for the whole test suite."""
+"""Generic fixtures for the whole test suite.
+
+The suite can be run in parallel with pytest-xdist (e.g. `pytest -n auto`): fixtures here
+and in the test modules only keep state in `tmp_path` or in the worker's own process.
+"""
 
 import pytest
 
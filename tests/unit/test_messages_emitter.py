@@ -18,7 +18,7 @@
 
 import logging
 import sys
-from unittest.mock import call, patch
+from unittest.mock import MagicMock, call, patch
 
 import pytest
 
@@ -26,125 +26,207 @@ from craft_cli import messages
 from craft_cli.errors import CraftError
 from craft_cli.messages import Emitter, EmitterMode, _Handler
 
+# the root logger handler is removed before each test (see fixture below), so there is
+# no state leaking between tests that would require running them with --forked
+pytestmark = pytest.mark.no_fork
+
+# the modes that behave similarly, grouped as used in most tests
+_QUIETISH = (EmitterMode.QUIET, EmitterMode.NORMAL)
+_VERBOSEISH = (EmitterMode.VERBOSE, EmitterMode.TRACE)
+
+# all the Emitter methods that can only be called after init
+_PUBLIC_METHODS = [x for x in dir(Emitter) if x[0] != "_" and x != "init"]
+
+_ROOT_LOGGER = logging.getLogger("")
+
+_FULL_DOCS_MESSAGE = "For more information, check out: https://charmhub.io/docs/whatever"
+
+
+def _reporterror_calls(log_filepath, *middle_lines, use_timestamp):
+    """Build the printer calls expected when reporting an error with "test message".
+
+    The middle lines are (stream, text) pairs shown between the error message and the
+    final log location.
+    """
+    texts = [(sys.stderr, "test message")]
+    texts.extend(middle_lines)
+    texts.append((sys.stderr, f"Full execution log: {log_filepath!r}"))
+    calls = [
+        call().show(stream, text, use_timestamp=use_timestamp, end_line=True)
+        for stream, text in texts
+    ]
+    calls.append(call().stop())
+    return calls
+
+
+def _get_craft_handlers():
+    """Return the handlers installed by the Emitter in the root logger."""
+    return [x for x in _ROOT_LOGGER.handlers if isinstance(x, _Handler)]
+
+
+def _get_craft_handler():
+    """Return the handler installed by the Emitter, validating it's the only one."""
+    (handler,) = _get_craft_handlers()
+    return handler
+
 
 @pytest.fixture(autouse=True)
 def clean_logging_handler():
     """Remove the used handler to properly isolate tests."""
-    logger = logging.getLogger("")
-    to_remove = [x for x in logger.handlers if isinstance(x, _Handler)]
-    for handler in to_remove:
-        logger.removeHandler(handler)
+    for handler in _get_craft_handlers():
+        _ROOT_LOGGER.removeHandler(handler)
 
 
 class RecordingEmitter(Emitter):
     """Class to cheat pyright.
 
     Otherwise it complains I'm setting printer_class to Emitter.
+
+    The attribute is only declared here, `get_initiated_emitter` sets it to the mock calls.
     """
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.printer_calls = []
+    printer_calls: list
+
+
+@pytest.fixture(scope="module")
+def module_printer_mock():
+    """Replace the printer once for the whole module."""
+    orig_printer = messages._Printer
+    mock_printer = MagicMock()
+    messages._Printer = mock_printer
+    try:
+        yield mock_printer
+    finally:
+        messages._Printer = orig_printer
+
+
+@pytest.fixture
+def raw_printer_patch(module_printer_mock):
+    """Provide the patched printer, clean and without initiating any Emitter."""
+    module_printer_mock.reset_mock()
+    return module_printer_mock
+
+
+@pytest.fixture
+def patched_log_filepath(tmp_path, monkeypatch):
+    """Avoid using a real log file, provide the fake one that is used instead."""
+    fake_logpath = str(tmp_path / "fakelog.log")
+    monkeypatch.setattr(messages, "_get_log_filepath", lambda appname: fake_logpath)
+    return fake_logpath
 
 
 @pytest.fixture
-def get_initiated_emitter(tmp_path, monkeypatch):
+def get_initiated_emitter(patched_log_filepath, module_printer_mock):
     """Provide an initiated Emitter ready to test.
 
     It has a patched "printer" and an easy way to test its calls (after it was initiated).
 
     It's used almost in all tests (except those that test the init call).
     """
-    fake_logpath = str(tmp_path / "fakelog.log")
-    monkeypatch.setattr(messages, "_get_log_filepath", lambda appname: fake_logpath)
-    with patch("craft_cli.messages._Printer", autospec=True) as mock_printer:
 
-        def func(mode, greeting="default greeting"):
-            emitter = RecordingEmitter()
-            emitter.init(mode, "testappname", greeting)
-            emitter.printer_calls = mock_printer.mock_calls
-            emitter.printer_calls.clear()
-            return emitter
+    def func(mode, greeting="default greeting"):
+        module_printer_mock.reset_mock()
+        emitter = RecordingEmitter()
+        emitter.init(mode, "testappname", greeting)
+        emitter.printer_calls = module_printer_mock.mock_calls
+        emitter.printer_calls.clear()
+        return emitter
+
+    return func
 
-        yield func
+
+@pytest.fixture(scope="module")
+def chained_craft_error():
+    """Provide a CraftError that was originated after other exception."""
+    try:
+        try:
+            raise ValueError("original")
+        except ValueError as err:
+            raise CraftError("test message") from err
+    except CraftError as err:
+        return err
+
+
+@pytest.fixture(scope="module")
+def complete_craft_error():
+    """Provide a chained CraftError also having all the optional information."""
+    try:
+        try:
+            raise ValueError("original")
+        except ValueError as err:
+            raise CraftError(
+                "test message",
+                details="boom",
+                resolution="run",
+                docs_url="https://charmhub.io/docs/whatever",
+            ) from err
+    except CraftError as err:
+        return err
+
+
+@pytest.fixture
+def fake_traceback_lines(monkeypatch):
+    """Produce fixed traceback lines; provide the exceptions they were requested for."""
+    received = []
+
+    def fake(exc):
+        received.append(exc)
+        return ["traceback line 1", "traceback line 2"]
+
+    monkeypatch.setattr(messages, "_get_traceback_lines", fake)
+    return received
 
 
 # -- tests for init and setting/getting mode
 
 
-@pytest.mark.parametrize(
-    "mode",
-    [
-        EmitterMode.QUIET,
-        EmitterMode.NORMAL,
-    ],
-)
-def test_init_quietish(mode, tmp_path, monkeypatch):
+@pytest.mark.parametrize("mode", _QUIETISH)
+def test_init_quietish(mode, patched_log_filepath, raw_printer_patch):
     """Init the class in some quiet-ish mode."""
-    # avoid using a real log file
-    fake_logpath = str(tmp_path / "fakelog.log")
-    monkeypatch.setattr(messages, "_get_log_filepath", lambda appname: fake_logpath)
-
     greeting = "greeting"
     emitter = Emitter()
-    with patch("craft_cli.messages._Printer") as mock_printer:
-        emitter.init(mode, "testappname", greeting)
+    emitter.init(mode, "testappname", greeting)
 
     assert emitter._mode == mode
-    assert mock_printer.mock_calls == [
-        call(fake_logpath),  # the _Printer instantiation, passing the log filepath
+    assert raw_printer_patch.mock_calls == [
+        call(patched_log_filepath),  # the _Printer instantiation, passing the log filepath
         call().show(None, "greeting"),  # the greeting, only sent to the log
     ]
 
     # log handler is properly setup
-    logger = logging.getLogger("")
-    (handler,) = [x for x in logger.handlers if isinstance(x, _Handler)]
-    assert handler.mode == mode
-
-
-@pytest.mark.parametrize(
-    "mode",
-    [
-        EmitterMode.VERBOSE,
-        EmitterMode.TRACE,
-    ],
-)
-def test_init_verboseish(mode, tmp_path, monkeypatch):
-    """Init the class in some verbose-ish mode."""
-    # avoid using a real log file
-    fake_logpath = str(tmp_path / "fakelog.log")
-    monkeypatch.setattr(messages, "_get_log_filepath", lambda appname: fake_logpath)
+    assert _get_craft_handler().mode == mode
 
+
+@pytest.mark.parametrize("mode", _VERBOSEISH)
+def test_init_verboseish(mode, patched_log_filepath, raw_printer_patch):
+    """Init the class in some verbose-ish mode."""
     greeting = "greeting"
     emitter = Emitter()
-    with patch("craft_cli.messages._Printer") as mock_printer:
-        emitter.init(mode, "testappname", greeting)
+    emitter.init(mode, "testappname", greeting)
 
     assert emitter._mode == mode
-    log_locat = f"Logging execution to {fake_logpath!r}"
-    assert mock_printer.mock_calls == [
-        call(fake_logpath),  # the _Printer instantiation, passing the log filepath
+    log_locat = f"Logging execution to {patched_log_filepath!r}"
+    assert raw_printer_patch.mock_calls == [
+        call(patched_log_filepath),  # the _Printer instantiation, passing the log filepath
         call().show(None, "greeting"),  # the greeting, only sent to the log
         call().show(sys.stderr, greeting, use_timestamp=True, end_line=True, avoid_logging=True),
         call().show(sys.stderr, log_locat, use_timestamp=True, end_line=True, avoid_logging=True),
     ]
 
     # log handler is properly setup
-    logger = logging.getLogger("")
-    (handler,) = [x for x in logger.handlers if isinstance(x, _Handler)]
-    assert handler.mode == mode
+    assert _get_craft_handler().mode == mode
 
 
-@pytest.mark.parametrize("method_name", [x for x in dir(Emitter) if x[0] != "_" and x != "init"])
-def test_needs_init(method_name):
+def test_needs_init():
     """Check that calling other methods needs emitter first to be initiated."""
-    emitter = Emitter()
-    method = getattr(emitter, method_name)
-    with pytest.raises(RuntimeError, match="Emitter needs to be initiated first"):
-        method()
+    for method_name in _PUBLIC_METHODS:
+        emitter = Emitter()
+        method = getattr(emitter, method_name)
+        with pytest.raises(RuntimeError, match="Emitter needs to be initiated first"):
+            method()
 
 
-def test_init_receiving_logfile(tmp_path, monkeypatch):
+def test_init_receiving_logfile(tmp_path, monkeypatch, raw_printer_patch):
     """Init the class in some verbose-ish mode."""
     # ensure it's not using the standard log filepath provider (that pollutes user dirs)
     monkeypatch.setattr(messages, "_get_log_filepath", None)
@@ -152,12 +234,11 @@ def test_init_receiving_logfile(tmp_path, monkeypatch):
     greeting = "greeting"
     emitter = Emitter()
     fake_logpath = tmp_path / "fakelog.log"
-    with patch("craft_cli.messages._Printer") as mock_printer:
-        emitter.init(EmitterMode.VERBOSE, "testappname", greeting, log_filepath=fake_logpath)
+    emitter.init(EmitterMode.VERBOSE, "testappname", greeting, log_filepath=fake_logpath)
 
     # filepath is properly informed and passed to the printer
     log_locat = f"Logging execution to {str(fake_logpath)!r}"
-    assert mock_printer.mock_calls == [
+    assert raw_printer_patch.mock_calls == [
         call(fake_logpath),  # the _Printer instantiation, passing the log filepath
         call().show(None, "greeting"),  # the greeting, only sent to the log
         call().show(sys.stderr, greeting, use_timestamp=True, end_line=True, avoid_logging=True),
@@ -165,43 +246,30 @@ def test_init_receiving_logfile(tmp_path, monkeypatch):
     ]
 
 
-def test_init_double_regular_mode(tmp_path, monkeypatch):
+@pytest.mark.usefixtures("patched_log_filepath", "raw_printer_patch")
+def test_init_double_regular_mode():
     """Double init in regular usage mode."""
-    # ensure it's not using the standard log filepath provider (that pollutes user dirs)
-    monkeypatch.setattr(messages, "_get_log_filepath", lambda appname: tmp_path / "fakelog.log")
-
     emitter = Emitter()
+    emitter.init(EmitterMode.VERBOSE, "testappname", "greeting")
 
-    with patch("craft_cli.messages._Printer"):
+    with pytest.raises(RuntimeError, match="Double Emitter init detected!"):
         emitter.init(EmitterMode.VERBOSE, "testappname", "greeting")
 
-        with pytest.raises(RuntimeError, match="Double Emitter init detected!"):
-            emitter.init(EmitterMode.VERBOSE, "testappname", "greeting")
-
 
-def test_init_double_tests_mode(tmp_path, monkeypatch):
+@pytest.mark.usefixtures("patched_log_filepath", "raw_printer_patch")
+def test_init_double_tests_mode(monkeypatch):
     """Double init in tests usage mode."""
-    # ensure it's not using the standard log filepath provider (that pollutes user dirs)
-    monkeypatch.setattr(messages, "_get_log_filepath", lambda appname: tmp_path / "fakelog.log")
-
     monkeypatch.setattr(messages, "TESTMODE", True)
     emitter = Emitter()
 
-    with patch("craft_cli.messages._Printer"):
-        with patch.object(emitter, "_stop") as mock_stop:
-            emitter.init(EmitterMode.VERBOSE, "testappname", "greeting")
-            assert mock_stop.called is False
-            emitter.init(EmitterMode.VERBOSE, "testappname", "greeting")
-            assert mock_stop.called is True
-
-
-@pytest.mark.parametrize(
-    "mode",
-    [
-        EmitterMode.QUIET,
-        EmitterMode.NORMAL,
-    ],
-)
+    with patch.object(emitter, "_stop") as mock_stop:
+        emitter.init(EmitterMode.VERBOSE, "testappname", "greeting")
+        assert mock_stop.called is False
+        emitter.init(EmitterMode.VERBOSE, "testappname", "greeting")
+        assert mock_stop.called is True
+
+
+@pytest.mark.parametrize("mode", _QUIETISH)
 def test_set_mode_quietish(get_initiated_emitter, mode):
     """Set the class to some quiet-ish mode."""
     greeting = "greeting"
@@ -210,21 +278,13 @@ def test_set_mode_quietish(get_initiated_emitter, mode):
 
     assert emitter._mode == mode
     assert emitter.get_mode() == mode
-    assert emitter.printer_calls == []
+    assert not emitter.printer_calls
 
     # log handler is affected
-    logger = logging.getLogger("")
-    (handler,) = [x for x in logger.handlers if isinstance(x, _Handler)]
-    assert handler.mode == mode
-
-
-@pytest.mark.parametrize(
-    "mode",
-    [
-        EmitterMode.VERBOSE,
-        EmitterMode.TRACE,
-    ],
-)
+    assert _get_craft_handler().mode == mode
+
+
+@pytest.mark.parametrize("mode", _VERBOSEISH)
 def test_set_mode_verboseish(get_initiated_emitter, mode):
     """Set the class to some verbose-ish mode."""
     greeting = "greeting"
@@ -240,75 +300,54 @@ def test_set_mode_verboseish(get_initiated_emitter, mode):
     ]
 
     # log handler is affected
-    logger = logging.getLogger("")
-    (handler,) = [x for x in logger.handlers if isinstance(x, _Handler)]
-    assert handler.mode == mode
+    assert _get_craft_handler().mode == mode
 
 
 # -- tests for emitting messages of all kind
 
 
-@pytest.mark.parametrize("mode", EmitterMode)  # all modes!
-def test_message_final(get_initiated_emitter, mode):
+def test_message_final(get_initiated_emitter):
     """Emit a final message."""
-    emitter = get_initiated_emitter(mode)
-    emitter.message("some text")
+    for mode in EmitterMode:  # all modes!
+        emitter = get_initiated_emitter(mode)
+        emitter.message("some text")
 
-    assert emitter.printer_calls == [
-        call().show(sys.stdout, "some text", use_timestamp=False),
-    ]
+        assert emitter.printer_calls == [
+            call().show(sys.stdout, "some text", use_timestamp=False),
+        ]
 
 
-@pytest.mark.parametrize(
-    "mode",
-    [
-        EmitterMode.QUIET,
-        EmitterMode.NORMAL,
-    ],
-)
-def test_message_intermediate_quietish(get_initiated_emitter, mode):
+def test_message_intermediate_quietish(get_initiated_emitter):
     """Emit an intermediate message when in a quiet-ish mode."""
-    emitter = get_initiated_emitter(mode)
-    emitter.message("some text", intermediate=True)
+    for mode in _QUIETISH:
+        emitter = get_initiated_emitter(mode)
+        emitter.message("some text", intermediate=True)
 
-    assert emitter.printer_calls == [
-        call().show(sys.stdout, "some text", use_timestamp=False),
-    ]
+        assert emitter.printer_calls == [
+            call().show(sys.stdout, "some text", use_timestamp=False),
+        ]
 
 
-@pytest.mark.parametrize(
-    "mode",
-    [
-        EmitterMode.VERBOSE,
-        EmitterMode.TRACE,
-    ],
-)
-def test_message_intermediate_verboseish(get_initiated_emitter, mode):
+def test_message_intermediate_verboseish(get_initiated_emitter):
     """Emit an intermediate message when in a verbose-ish mode."""
-    emitter = get_initiated_emitter(mode)
-    emitter.message("some text", intermediate=True)
+    for mode in _VERBOSEISH:
+        emitter = get_initiated_emitter(mode)
+        emitter.message("some text", intermediate=True)
 
-    assert emitter.printer_calls == [
-        call().show(sys.stdout, "some text", use_timestamp=True),
-    ]
+        assert emitter.printer_calls == [
+            call().show(sys.stdout, "some text", use_timestamp=True),
+        ]
 
 
-@pytest.mark.parametrize(
-    "mode",
-    [
-        EmitterMode.QUIET,
-        EmitterMode.NORMAL,
-        EmitterMode.VERBOSE,
-    ],
-)
-def test_trace_in_non_trace_modes(get_initiated_emitter, mode):
+def test_trace_in_non_trace_modes(get_initiated_emitter):
     """Only log the message."""
-    emitter = get_initiated_emitter(mode)
-    emitter.trace("some text")
+    for mode in (EmitterMode.QUIET, EmitterMode.NORMAL, EmitterMode.VERBOSE):
+        emitter = get_initiated_emitter(mode)
+        emitter.trace("some text")
 
-    assert emitter.printer_calls == [
-        call().show(None, "some text", use_timestamp=True),
-    ]
+        assert emitter.printer_calls == [
+            call().show(None, "some text", use_timestamp=True),
+        ]
 
 
 def test_trace_in_trace_mode(get_initiated_emitter):
@@ -341,43 +380,30 @@ def test_progress_in_normal_mode(get_initiated_emitter):
     ]
 
 
-@pytest.mark.parametrize(
-    "mode",
-    [
-        EmitterMode.VERBOSE,
-        EmitterMode.TRACE,
-    ],
-)
-def test_progress_in_verboseish_modes(get_initiated_emitter, mode):
+def test_progress_in_verboseish_modes(get_initiated_emitter):
     """Send to stderr (permanent, with timestamp) and log it."""
-    emitter = get_initiated_emitter(mode)
-    emitter.progress("some text")
+    for mode in _VERBOSEISH:
+        emitter = get_initiated_emitter(mode)
+        emitter.progress("some text")
 
-    assert emitter.printer_calls == [
-        call().show(sys.stderr, "some text", use_timestamp=True, ephemeral=False),
-    ]
+        assert emitter.printer_calls == [
+            call().show(sys.stderr, "some text", use_timestamp=True, ephemeral=False),
+        ]
 
 
-@pytest.mark.parametrize(
-    "mode",
-    [
-        EmitterMode.NORMAL,
-        EmitterMode.VERBOSE,
-        EmitterMode.TRACE,
-    ],
-)
-def test_progressbar_in_useful_modes(get_initiated_emitter, mode):
+def test_progressbar_in_useful_modes(get_initiated_emitter):
     """Show the initial message to stderr and init _Progresser correctly."""
-    emitter = get_initiated_emitter(mode)
-    progresser = emitter.progress_bar("some text", 5000)
+    for mode in (EmitterMode.NORMAL, EmitterMode.VERBOSE, EmitterMode.TRACE):
+        emitter = get_initiated_emitter(mode)
+        progresser = emitter.progress_bar("some text", 5000)
 
-    assert emitter.printer_calls == [
-        call().show(sys.stderr, "some text", ephemeral=True),
-    ]
-    assert progresser.total == 5000
-    assert progresser.text == "some text"
-    assert progresser.stream == sys.stderr
-    assert progresser.delta is True
+        assert emitter.printer_calls == [
+            call().show(sys.stderr, "some text", ephemeral=True),
+        ]
+        assert progresser.total == 5000
+        assert progresser.text == "some text"
+        assert progresser.stream == sys.stderr
+        assert progresser.delta is True
 
 
 def test_progressbar_with_delta_false(get_initiated_emitter):
@@ -398,50 +424,38 @@ def test_progressbar_in_quiet_mode(get_initiated_emitter):
     assert progresser.stream is None
 
 
-@pytest.mark.parametrize(
-    "mode",
-    [
-        EmitterMode.QUIET,
-        EmitterMode.NORMAL,
-    ],
-)
-def test_openstream_in_quietish_modes(get_initiated_emitter, mode):
+def test_openstream_in_quietish_modes(get_initiated_emitter):
     """Return a stream context manager with the output stream in None."""
-    emitter = get_initiated_emitter(mode)
+    for mode in _QUIETISH:
+        emitter = get_initiated_emitter(mode)
 
-    with patch("craft_cli.messages._StreamContextManager") as stream_context_manager_mock:
-        instantiated_cm = object()
-        stream_context_manager_mock.return_value = instantiated_cm
-        context_manager = emitter.open_stream("some text")
+        with patch("craft_cli.messages._StreamContextManager") as stream_context_manager_mock:
+            instantiated_cm = object()
+            stream_context_manager_mock.return_value = instantiated_cm
+            context_manager = emitter.open_stream("some text")
 
-    assert emitter.printer_calls == []
-    assert context_manager is instantiated_cm
-    assert stream_context_manager_mock.mock_calls == [
-        call(emitter._printer, "some text", None),
-    ]
+        assert not emitter.printer_calls
+        assert context_manager is instantiated_cm
+        assert stream_context_manager_mock.mock_calls == [
+            call(emitter._printer, "some text", None),
+        ]
 
 
-@pytest.mark.parametrize(
-    "mode",
-    [
-        EmitterMode.VERBOSE,
-        EmitterMode.TRACE,
-    ],
-)
-def test_openstream_in_verboseish_modes(get_initiated_emitter, mode):
+def test_openstream_in_verboseish_modes(get_initiated_emitter):
     """Return a stream context manager with stderr as the output stream."""
-    emitter = get_initiated_emitter(mode)
+    for mode in _VERBOSEISH:
+        emitter = get_initiated_emitter(mode)
 
-    with patch("craft_cli.messages._StreamContextManager") as stream_context_manager_mock:
-        instantiated_cm = object()
-        stream_context_manager_mock.return_value = instantiated_cm
-        context_manager = emitter.open_stream("some text")
+        with patch("craft_cli.messages._StreamContextManager") as stream_context_manager_mock:
+            instantiated_cm = object()
+            stream_context_manager_mock.return_value = instantiated_cm
+            context_manager = emitter.open_stream("some text")
 
-    assert emitter.printer_calls == []
-    assert context_manager is instantiated_cm
-    assert stream_context_manager_mock.mock_calls == [
-        call(emitter._printer, "some text", sys.stderr),
-    ]
+        assert not emitter.printer_calls
+        assert context_manager is instantiated_cm
+        assert stream_context_manager_mock.mock_calls == [
+            call(emitter._printer, "some text", sys.stderr),
+        ]
 
 
 # -- tests for stopping the machinery ok
@@ -462,7 +476,7 @@ def test_ended_double_after_ok(get_initiated_emitter):
     emitter.printer_calls.clear()
 
     emitter.ended_ok()
-    assert emitter.printer_calls == []
+    assert not emitter.printer_calls
 
 
 def test_ended_double_after_error(get_initiated_emitter):
@@ -472,232 +486,111 @@ def test_ended_double_after_error(get_initiated_emitter):
     emitter.printer_calls.clear()
 
     emitter.ended_ok()
-    assert emitter.printer_calls == []
+    assert not emitter.printer_calls
 
 
 # -- tests for error reporting
 
 
-@pytest.mark.parametrize("mode", [EmitterMode.QUIET, EmitterMode.NORMAL])
-def test_reporterror_simple_message_only_quietish(mode, get_initiated_emitter):
-    """Report just a simple message, in silent modes."""
-    emitter = get_initiated_emitter(mode)
-    error = CraftError("test message")
-    emitter.error(error)
-
-    full_log_message = f"Full execution log: {repr(emitter._log_filepath)}"
-    assert emitter.printer_calls == [
-        call().show(sys.stderr, "test message", use_timestamp=False, end_line=True),
-        call().show(sys.stderr, full_log_message, use_timestamp=False, end_line=True),
-        call().stop(),
-    ]
-
-
-@pytest.mark.parametrize("mode", [EmitterMode.VERBOSE, EmitterMode.TRACE])
-def test_reporterror_simple_message_only_verboseish(mode, get_initiated_emitter):
-    """Report just a simple message, in more verbose modes."""
+@pytest.mark.parametrize("mode", EmitterMode)  # all modes!
+def test_reporterror_simple_message_only(mode, get_initiated_emitter):
+    """Report just a simple message."""
     emitter = get_initiated_emitter(mode)
     error = CraftError("test message")
     emitter.error(error)
 
-    full_log_message = f"Full execution log: {repr(emitter._log_filepath)}"
-    assert emitter.printer_calls == [
-        call().show(sys.stderr, "test message", use_timestamp=True, end_line=True),
-        call().show(sys.stderr, full_log_message, use_timestamp=True, end_line=True),
-        call().stop(),
-    ]
+    use_timestamp = mode in _VERBOSEISH
+    expected = _reporterror_calls(emitter._log_filepath, use_timestamp=use_timestamp)
+    assert emitter.printer_calls == expected
 
 
-@pytest.mark.parametrize("mode", [EmitterMode.QUIET, EmitterMode.NORMAL])
-def test_reporterror_detailed_info_quietish(mode, get_initiated_emitter):
-    """Report an error having detailed information, in silent modes."""
-    emitter = get_initiated_emitter(mode)
-    error = CraftError("test message", details="boom")
-    emitter.error(error)
-
-    full_log_message = f"Full execution log: {repr(emitter._log_filepath)}"
-    assert emitter.printer_calls == [
-        call().show(sys.stderr, "test message", use_timestamp=False, end_line=True),
-        call().show(None, "Detailed information: boom", use_timestamp=False, end_line=True),
-        call().show(sys.stderr, full_log_message, use_timestamp=False, end_line=True),
-        call().stop(),
-    ]
-
-
-@pytest.mark.parametrize("mode", [EmitterMode.VERBOSE, EmitterMode.TRACE])
-def test_reporterror_detailed_info_verboseish(mode, get_initiated_emitter):
-    """Report an error having detailed information, in more verbose modes."""
+@pytest.mark.parametrize("mode", EmitterMode)  # all modes!
+def test_reporterror_detailed_info(mode, get_initiated_emitter):
+    """Report an error having detailed information."""
     emitter = get_initiated_emitter(mode)
     error = CraftError("test message", details="boom")
     emitter.error(error)
 
-    full_log_message = f"Full execution log: {repr(emitter._log_filepath)}"
-    assert emitter.printer_calls == [
-        call().show(sys.stderr, "test message", use_timestamp=True, end_line=True),
-        call().show(sys.stderr, "Detailed information: boom", use_timestamp=True, end_line=True),
-        call().show(sys.stderr, full_log_message, use_timestamp=True, end_line=True),
-        call().stop(),
-    ]
-
-
-@pytest.mark.parametrize("mode", [EmitterMode.QUIET, EmitterMode.NORMAL])
-def test_reporterror_chained_exception_quietish(mode, get_initiated_emitter):
-    """Report an error that was originated after other exception, in silent modes."""
-    emitter = get_initiated_emitter(mode)
-    try:
-        try:
-            raise ValueError("original")
-        except ValueError as err:
-            orig_exception = err
-            raise CraftError("test message") from err
-    except CraftError as err:
-        error = err
-
-    with patch("craft_cli.messages._get_traceback_lines") as tblines_mock:
-        tblines_mock.return_value = ["traceback line 1", "traceback line 2"]
-        emitter.error(error)
-
-    full_log_message = f"Full execution log: {repr(emitter._log_filepath)}"
-    assert emitter.printer_calls == [
-        call().show(sys.stderr, "test message", use_timestamp=False, end_line=True),
-        call().show(None, "traceback line 1", use_timestamp=False, end_line=True),
-        call().show(None, "traceback line 2", use_timestamp=False, end_line=True),
-        call().show(sys.stderr, full_log_message, use_timestamp=False, end_line=True),
-        call().stop(),
-    ]
-
-    # check the traceback lines are generated using the original exception
-    tblines_mock.assert_called_with(orig_exception)  # type: ignore
+    use_timestamp = mode in _VERBOSEISH
+    details_stream = None if mode in _QUIETISH else sys.stderr
+    expected = _reporterror_calls(
+        emitter._log_filepath,
+        (details_stream, "Detailed information: boom"),
+        use_timestamp=use_timestamp,
+    )
+    assert emitter.printer_calls == expected
 
 
-@pytest.mark.parametrize("mode", [EmitterMode.VERBOSE, EmitterMode.TRACE])
-def test_reporterror_chained_exception_verboseish(mode, get_initiated_emitter):
-    """Report an error that was originated after other exception, in more verbose modes."""
+@pytest.mark.parametrize("mode", EmitterMode)  # all modes!
+def test_reporterror_chained_exception(
+    mode, get_initiated_emitter, chained_craft_error, fake_traceback_lines
+):
+    """Report an error that was originated after other exception."""
     emitter = get_initiated_emitter(mode)
-    try:
-        try:
-            raise ValueError("original")
-        except ValueError as err:
-            orig_exception = err
-            raise CraftError("test message") from err
-    except CraftError as err:
-        error = err
-
-    with patch("craft_cli.messages._get_traceback_lines") as tblines_mock:
-        tblines_mock.return_value = ["traceback line 1", "traceback line 2"]
-        emitter.error(error)
-
-    full_log_message = f"Full execution log: {repr(emitter._log_filepath)}"
-    assert emitter.printer_calls == [
-        call().show(sys.stderr, "test message", use_timestamp=True, end_line=True),
-        call().show(sys.stderr, "traceback line 1", use_timestamp=True, end_line=True),
-        call().show(sys.stderr, "traceback line 2", use_timestamp=True, end_line=True),
-        call().show(sys.stderr, full_log_message, use_timestamp=True, end_line=True),
-        call().stop(),
-    ]
+    emitter.error(chained_craft_error)
+
+    use_timestamp = mode in _VERBOSEISH
+    details_stream = None if mode in _QUIETISH else sys.stderr
+    expected = _reporterror_calls(
+        emitter._log_filepath,
+        (details_stream, "traceback line 1"),
+        (details_stream, "traceback line 2"),
+        use_timestamp=use_timestamp,
+    )
+    assert emitter.printer_calls == expected
 
     # check the traceback lines are generated using the original exception
-    tblines_mock.assert_called_with(orig_exception)  # type: ignore
-
+    assert fake_traceback_lines == [chained_craft_error.__cause__]
 
-@pytest.mark.parametrize("mode", [EmitterMode.QUIET, EmitterMode.NORMAL])
-def test_reporterror_with_resolution_quietish(mode, get_initiated_emitter):
-    """Report an error with a recommended resolution, in silent modes."""
-    emitter = get_initiated_emitter(mode)
-    error = CraftError("test message", resolution="run")
-    emitter.error(error)
-
-    full_log_message = f"Full execution log: {repr(emitter._log_filepath)}"
-    assert emitter.printer_calls == [
-        call().show(sys.stderr, "test message", use_timestamp=False, end_line=True),
-        call().show(sys.stderr, "Recommended resolution: run", use_timestamp=False, end_line=True),
-        call().show(sys.stderr, full_log_message, use_timestamp=False, end_line=True),
-        call().stop(),
-    ]
 
-
-@pytest.mark.parametrize("mode", [EmitterMode.VERBOSE, EmitterMode.TRACE])
-def test_reporterror_with_resolution_verboseish(mode, get_initiated_emitter):
-    """Report an error with a recommended resolution, in more verbose modes."""
+@pytest.mark.parametrize("mode", EmitterMode)  # all modes!
+def test_reporterror_with_resolution(mode, get_initiated_emitter):
+    """Report an error with a recommended resolution."""
     emitter = get_initiated_emitter(mode)
     error = CraftError("test message", resolution="run")
     emitter.error(error)
 
-    full_log_message = f"Full execution log: {repr(emitter._log_filepath)}"
-    assert emitter.printer_calls == [
-        call().show(sys.stderr, "test message", use_timestamp=True, end_line=True),
-        call().show(sys.stderr, "Recommended resolution: run", use_timestamp=True, end_line=True),
-        call().show(sys.stderr, full_log_message, use_timestamp=True, end_line=True),
-        call().stop(),
-    ]
+    use_timestamp = mode in _VERBOSEISH
+    expected = _reporterror_calls(
+        emitter._log_filepath,
+        (sys.stderr, "Recommended resolution: run"),
+        use_timestamp=use_timestamp,
+    )
+    assert emitter.printer_calls == expected
 
 
-@pytest.mark.parametrize("mode", [EmitterMode.QUIET, EmitterMode.NORMAL])
-def test_reporterror_with_docs_quietish(mode, get_initiated_emitter):
-    """Report including a docs url, in silent modes."""
-    emitter = get_initiated_emitter(mode)
-    error = CraftError("test message", docs_url="https://charmhub.io/docs/whatever")
-    emitter.error(error)
-
-    full_log_message = f"Full execution log: {repr(emitter._log_filepath)}"
-    full_docs_message = "For more information, check out: https://charmhub.io/docs/whatever"
-    assert emitter.printer_calls == [
-        call().show(sys.stderr, "test message", use_timestamp=False, end_line=True),
-        call().show(sys.stderr, full_docs_message, use_timestamp=False, end_line=True),
-        call().show(sys.stderr, full_log_message, use_timestamp=False, end_line=True),
-        call().stop(),
-    ]
-
-
-@pytest.mark.parametrize("mode", [EmitterMode.VERBOSE, EmitterMode.TRACE])
-def test_reporterror_with_docs_verboseish(mode, get_initiated_emitter):
-    """Report including a docs url, in more verbose modes."""
+@pytest.mark.parametrize("mode", EmitterMode)  # all modes!
+def test_reporterror_with_docs(mode, get_initiated_emitter):
+    """Report including a docs url."""
     emitter = get_initiated_emitter(mode)
     error = CraftError("test message", docs_url="https://charmhub.io/docs/whatever")
     emitter.error(error)
 
-    full_log_message = f"Full execution log: {repr(emitter._log_filepath)}"
-    full_docs_message = "For more information, check out: https://charmhub.io/docs/whatever"
-    assert emitter.printer_calls == [
-        call().show(sys.stderr, "test message", use_timestamp=True, end_line=True),
-        call().show(sys.stderr, full_docs_message, use_timestamp=True, end_line=True),
-        call().show(sys.stderr, full_log_message, use_timestamp=True, end_line=True),
-        call().stop(),
-    ]
+    use_timestamp = mode in _VERBOSEISH
+    expected = _reporterror_calls(
+        emitter._log_filepath,
+        (sys.stderr, _FULL_DOCS_MESSAGE),
+        use_timestamp=use_timestamp,
+    )
+    assert emitter.printer_calls == expected
 
 
-def test_reporterror_full_complete(get_initiated_emitter):
+@pytest.mark.usefixtures("fake_traceback_lines")
+def test_reporterror_full_complete(get_initiated_emitter, complete_craft_error):
     """Sanity case to check order between the different parts."""
     emitter = get_initiated_emitter(EmitterMode.TRACE)
-    try:
-        try:
-            raise ValueError("original")
-        except ValueError as err:
-            raise CraftError(
-                "test message",
-                details="boom",
-                resolution="run",
-                docs_url="https://charmhub.io/docs/whatever",
-            ) from err
-    except CraftError as err:
-        error = err
-
-    with patch("craft_cli.messages._get_traceback_lines") as tblines_mock:
-        tblines_mock.return_value = ["traceback line 1", "traceback line 2"]
-        emitter.error(error)
+    emitter.error(complete_craft_error)
 
-    full_log_message = f"Full execution log: {repr(emitter._log_filepath)}"
-    full_docs_message = "For more information, check out: https://charmhub.io/docs/whatever"
-    assert emitter.printer_calls == [
-        call().show(sys.stderr, "test message", use_timestamp=True, end_line=True),
-        call().show(sys.stderr, "Detailed information: boom", use_timestamp=True, end_line=True),
-        call().show(sys.stderr, "traceback line 1", use_timestamp=True, end_line=True),
-        call().show(sys.stderr, "traceback line 2", use_timestamp=True, end_line=True),
-        call().show(sys.stderr, "Recommended resolution: run", use_timestamp=True, end_line=True),
-        call().show(sys.stderr, full_docs_message, use_timestamp=True, end_line=True),
-        call().show(sys.stderr, full_log_message, use_timestamp=True, end_line=True),
-        call().stop(),
-    ]
+    expected = _reporterror_calls(
+        emitter._log_filepath,
+        (sys.stderr, "Detailed information: boom"),
+        (sys.stderr, "traceback line 1"),
+        (sys.stderr, "traceback line 2"),
+        (sys.stderr, "Recommended resolution: run"),
+        (sys.stderr, _FULL_DOCS_MESSAGE),
+        use_timestamp=True,
+    )
+    assert emitter.printer_calls == expected
 
 
 def test_reporterror_double_after_ok(get_initiated_emitter):
@@ -707,7 +600,7 @@ def test_reporterror_double_after_ok(get_initiated_emitter):
     emitter.printer_calls.clear()
 
     emitter.error(CraftError("test message"))
-    assert emitter.printer_calls == []
+    assert not emitter.printer_calls
 
 
 def test_reporterror_double_after_error(get_initiated_emitter):
@@ -717,4 +610,4 @@ def test_reporterror_double_after_error(get_initiated_emitter):
     emitter.printer_calls.clear()
 
     emitter.error(CraftError("test message"))
-    assert emitter.printer_calls == []
+    assert not emitter.printer_calls